@@ -10,4 +10,4 @@ from fastmcp import FastMCP
 mcp = FastMCP("Databricks MCP Server")
 
 # Import and register all tools
-from .tools import sql, compute, file, pipelines, jobs, pdf, agent_bricks
+from .tools import sql, compute, file, pipelines, jobs, pdf, agent_bricks, unity_catalog
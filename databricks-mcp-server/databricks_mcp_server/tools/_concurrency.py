@@ -0,0 +1,25 @@
+"""Shared thread pool for running blocking SDK calls from async tools.
+
+asyncio.to_thread uses the event loop's default executor, which is capped at
+min(32, cpus + 4) threads and shared with anything else the process offloads.
+A dedicated pool keeps slow Databricks round-trips (e.g. waiting on a pipeline
+update) from starving unrelated work, and makes the concurrency limit
+explicitly tunable.
+"""
+import asyncio
+import atexit
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("DATABRICKS_MCP_IO_THREADS", "64")),
+    thread_name_prefix="dbx-mcp-io",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run a blocking callable on the shared I/O pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, functools.partial(fn, *args, **kwargs))
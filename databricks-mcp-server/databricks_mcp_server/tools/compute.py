@@ -10,21 +10,22 @@ from databricks_tools_core.compute import (
 )
 
 from ..server import mcp
+from ._concurrency import run_blocking
 
 
 @mcp.tool
-def list_clusters() -> List[Dict[str, Any]]:
+async def list_clusters() -> List[Dict[str, Any]]:
     """
     List all clusters in the workspace.
 
     Returns:
         List of cluster info dicts with cluster_id, cluster_name, state, etc.
     """
-    return _list_clusters()
+    return await run_blocking(_list_clusters)
 
 
 @mcp.tool
-def get_best_cluster() -> Dict[str, Any]:
+async def get_best_cluster() -> Dict[str, Any]:
     """
     Get the ID of the best available cluster for code execution.
 
@@ -37,12 +38,12 @@ def get_best_cluster() -> Dict[str, Any]:
     Returns:
         Dictionary with cluster_id (string or None if no running cluster).
     """
-    cluster_id = _get_best_cluster()
+    cluster_id = await run_blocking(_get_best_cluster)
     return {"cluster_id": cluster_id}
 
 
 @mcp.tool
-def execute_databricks_command(
+async def execute_databricks_command(
     code: str,
     cluster_id: Optional[str] = None,
     context_id: Optional[str] = None,
@@ -87,7 +88,8 @@ def execute_databricks_command(
         context_id = None
     
     try:
-        result = _execute_databricks_command(
+        result = await run_blocking(
+            _execute_databricks_command,
             code=code,
             cluster_id=cluster_id,
             context_id=context_id,
@@ -110,7 +112,7 @@ def execute_databricks_command(
 
 
 @mcp.tool
-def run_python_file_on_databricks(
+async def run_python_file_on_databricks(
     file_path: str,
     cluster_id: Optional[str] = None,
     context_id: Optional[str] = None,
@@ -152,7 +154,8 @@ def run_python_file_on_databricks(
         context_id = None
     
     try:
-        result = _run_python_file_on_databricks(
+        result = await run_blocking(
+            _run_python_file_on_databricks,
             file_path=file_path,
             cluster_id=cluster_id,
             context_id=context_id,
@@ -7,10 +7,11 @@ from databricks_tools_core.file import (
 )
 
 from ..server import mcp
+from ._concurrency import run_blocking
 
 
 @mcp.tool
-def upload_folder(
+async def upload_folder(
     local_folder: str,
     workspace_folder: str,
     max_workers: int = 10,
@@ -38,7 +39,8 @@ def upload_folder(
         - failed: Number of failed uploads
         - success: True if all uploads succeeded
     """
-    result = _upload_folder(
+    result = await run_blocking(
+        _upload_folder,
         local_folder=local_folder,
         workspace_folder=workspace_folder,
         max_workers=max_workers,
@@ -59,7 +61,7 @@ def upload_folder(
 
 
 @mcp.tool
-def upload_file(
+async def upload_file(
     local_path: str,
     workspace_path: str,
     overwrite: bool = True,
@@ -79,7 +81,8 @@ def upload_file(
         - success: True if upload succeeded
         - error: Error message if failed
     """
-    result = _upload_file(
+    result = await run_blocking(
+        _upload_file,
         local_path=local_path,
         workspace_path=workspace_path,
         overwrite=overwrite,
@@ -18,10 +18,11 @@ from databricks_tools_core.jobs import (
 )
 
 from ..server import mcp
+from ._concurrency import run_blocking
 
 
 @mcp.tool
-def list_jobs(
+async def list_jobs(
     name: Optional[str] = None,
     limit: int = 25,
     expand_tasks: bool = False,
@@ -37,11 +38,11 @@ def list_jobs(
     Returns:
         List of job info dicts with job_id, name, creator, created_time, etc.
     """
-    return _list_jobs(name=name, limit=limit, expand_tasks=expand_tasks)
+    return await run_blocking(_list_jobs, name=name, limit=limit, expand_tasks=expand_tasks)
 
 
 @mcp.tool
-def get_job(job_id: int) -> Dict[str, Any]:
+async def get_job(job_id: int) -> Dict[str, Any]:
     """
     Get detailed job configuration.
 
@@ -51,11 +52,11 @@ def get_job(job_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with full job configuration including tasks, clusters, schedule, etc.
     """
-    return _get_job(job_id=job_id)
+    return await run_blocking(_get_job, job_id=job_id)
 
 
 @mcp.tool
-def find_job_by_name(name: str) -> Optional[int]:
+async def find_job_by_name(name: str) -> Optional[int]:
     """
     Find a job by exact name and return its ID.
 
@@ -65,11 +66,11 @@ def find_job_by_name(name: str) -> Optional[int]:
     Returns:
         Job ID if found, None otherwise.
     """
-    return _find_job_by_name(name=name)
+    return await run_blocking(_find_job_by_name, name=name)
 
 
 @mcp.tool
-def create_job(
+async def create_job(
     name: str,
     tasks: List[Dict[str, Any]],
     job_clusters: Optional[List[Dict[str, Any]]] = None,
@@ -130,7 +131,8 @@ def create_job(
         >>> job = create_job(name="my_etl_job", tasks=tasks)
         >>> print(job["job_id"])
     """
-    return _create_job(
+    return await run_blocking(
+        _create_job,
         name=name,
         tasks=tasks,
         job_clusters=job_clusters,
@@ -151,7 +153,7 @@ def create_job(
 
 
 @mcp.tool
-def update_job(
+async def update_job(
     job_id: int,
     name: Optional[str] = None,
     tasks: Optional[List[Dict[str, Any]]] = None,
@@ -195,7 +197,8 @@ def update_job(
         health: New health monitoring rules.
         deployment: New deployment configuration.
     """
-    _update_job(
+    await run_blocking(
+        _update_job,
         job_id=job_id,
         name=name,
         tasks=tasks,
@@ -217,18 +220,18 @@ def update_job(
 
 
 @mcp.tool
-def delete_job(job_id: int) -> None:
+async def delete_job(job_id: int) -> None:
     """
     Delete a job permanently.
 
     Args:
         job_id: Job ID to delete.
     """
-    _delete_job(job_id=job_id)
+    await run_blocking(_delete_job, job_id=job_id)
 
 
 @mcp.tool
-def run_job_now(
+async def run_job_now(
     job_id: int,
     idempotency_token: Optional[str] = None,
     jar_params: Optional[List[str]] = None,
@@ -264,7 +267,8 @@ def run_job_now(
         >>> run_id = run_job_now(job_id=123, notebook_params={"env": "prod"})
         >>> print(f"Started run {run_id}")
     """
-    return _run_job_now(
+    return await run_blocking(
+        _run_job_now,
         job_id=job_id,
         idempotency_token=idempotency_token,
         jar_params=jar_params,
@@ -280,7 +284,7 @@ def run_job_now(
 
 
 @mcp.tool
-def get_run(run_id: int) -> Dict[str, Any]:
+async def get_run(run_id: int) -> Dict[str, Any]:
     """
     Get detailed run status and information.
 
@@ -290,11 +294,11 @@ def get_run(run_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with run details including state, start_time, end_time, tasks, etc.
     """
-    return _get_run(run_id=run_id)
+    return await run_blocking(_get_run, run_id=run_id)
 
 
 @mcp.tool
-def get_run_output(run_id: int) -> Dict[str, Any]:
+async def get_run_output(run_id: int) -> Dict[str, Any]:
     """
     Get run output including logs and results.
 
@@ -304,22 +308,22 @@ def get_run_output(run_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with run output including logs, error messages, and task outputs.
     """
-    return _get_run_output(run_id=run_id)
+    return await run_blocking(_get_run_output, run_id=run_id)
 
 
 @mcp.tool
-def cancel_run(run_id: int) -> None:
+async def cancel_run(run_id: int) -> None:
     """
     Cancel a running job.
 
     Args:
         run_id: Run ID to cancel.
     """
-    _cancel_run(run_id=run_id)
+    await run_blocking(_cancel_run, run_id=run_id)
 
 
 @mcp.tool
-def list_runs(
+async def list_runs(
     job_id: Optional[int] = None,
     active_only: bool = False,
     completed_only: bool = False,
@@ -350,7 +354,8 @@ def list_runs(
         >>> # Get all active runs
         >>> active_runs = list_runs(active_only=True)
     """
-    return _list_runs(
+    return await run_blocking(
+        _list_runs,
         job_id=job_id,
         active_only=active_only,
         completed_only=completed_only,
@@ -362,7 +367,7 @@ def list_runs(
 
 
 @mcp.tool
-def wait_for_run(
+async def wait_for_run(
     run_id: int,
     timeout: int = 3600,
     poll_interval: int = 10,
@@ -392,5 +397,7 @@ def wait_for_run(
         ... else:
         ...     print(f"Job failed: {result['error_message']}")
     """
-    result = _wait_for_run(run_id=run_id, timeout=timeout, poll_interval=poll_interval)
+    result = await run_blocking(
+        _wait_for_run, run_id=run_id, timeout=timeout, poll_interval=poll_interval
+    )
     return result.to_dict()
@@ -1,5 +1,6 @@
 """Pipeline tools - Manage Spark Declarative Pipelines (SDP)."""
-from typing import List, Optional, Dict, Any
+import time
+from typing import List, Optional, Dict, Any, Tuple
 
 from databricks_tools_core.spark_declarative_pipelines.pipelines import (
     create_pipeline as _create_pipeline,
@@ -15,10 +16,22 @@ from databricks_tools_core.spark_declarative_pipelines.pipelines import (
 )
 
 from ..server import mcp
+from ._concurrency import run_blocking
+
+# Agents poll pipeline specs far more often than specs change; a short TTL
+# cache absorbs repeated get_pipeline calls within one trajectory. Entries are
+# (result_dict, timestamp); mutating tools drop the entry so stale reads can't
+# outlive a change made through this server.
+_PIPELINE_CACHE_TTL_SECONDS = 5.0
+_pipeline_cache: Dict[str, Tuple[Dict[str, Any], float]] = {}
+
+
+def _invalidate_pipeline_cache(pipeline_id: str) -> None:
+    _pipeline_cache.pop(pipeline_id, None)
 
 
 @mcp.tool
-def create_pipeline(
+async def create_pipeline(
     name: str,
     root_path: str,
     catalog: str,
@@ -42,7 +55,8 @@ def create_pipeline(
     Returns:
         Dictionary with pipeline_id of the created pipeline.
     """
-    result = _create_pipeline(
+    result = await run_blocking(
+        _create_pipeline,
         name=name,
         root_path=root_path,
         catalog=catalog,
@@ -54,7 +68,7 @@ def create_pipeline(
 
 
 @mcp.tool
-def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
+async def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
     """
     Get pipeline details and configuration.
 
@@ -64,12 +78,18 @@ def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with pipeline configuration and state.
     """
-    result = _get_pipeline(pipeline_id=pipeline_id)
-    return result.as_dict() if hasattr(result, 'as_dict') else vars(result)
+    cached = _pipeline_cache.get(pipeline_id)
+    if cached and time.time() - cached[1] < _PIPELINE_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    result = await run_blocking(_get_pipeline, pipeline_id=pipeline_id)
+    result_dict = result.as_dict() if hasattr(result, 'as_dict') else vars(result)
+    _pipeline_cache[pipeline_id] = (result_dict, time.time())
+    return result_dict
 
 
 @mcp.tool
-def update_pipeline(
+async def update_pipeline(
     pipeline_id: str,
     name: Optional[str] = None,
     root_path: Optional[str] = None,
@@ -95,7 +115,8 @@ def update_pipeline(
     Returns:
         Dictionary with status message.
     """
-    _update_pipeline(
+    await run_blocking(
+        _update_pipeline,
         pipeline_id=pipeline_id,
         name=name,
         root_path=root_path,
@@ -104,11 +125,12 @@ def update_pipeline(
         workspace_file_paths=workspace_file_paths,
         extra_settings=extra_settings,
     )
+    _invalidate_pipeline_cache(pipeline_id)
     return {"status": "updated"}
 
 
 @mcp.tool
-def delete_pipeline(pipeline_id: str) -> Dict[str, str]:
+async def delete_pipeline(pipeline_id: str) -> Dict[str, str]:
     """
     Delete a pipeline.
 
@@ -118,12 +140,13 @@ def delete_pipeline(pipeline_id: str) -> Dict[str, str]:
     Returns:
         Dictionary with status message.
     """
-    _delete_pipeline(pipeline_id=pipeline_id)
+    await run_blocking(_delete_pipeline, pipeline_id=pipeline_id)
+    _invalidate_pipeline_cache(pipeline_id)
     return {"status": "deleted"}
 
 
 @mcp.tool
-def start_update(
+async def start_update(
     pipeline_id: str,
     refresh_selection: Optional[List[str]] = None,
     full_refresh: bool = False,
@@ -143,34 +166,51 @@ def start_update(
     Returns:
         Dictionary with update_id for polling status.
     """
-    update_id = _start_update(
+    update_id = await run_blocking(
+        _start_update,
         pipeline_id=pipeline_id,
         refresh_selection=refresh_selection,
         full_refresh=full_refresh,
         full_refresh_selection=full_refresh_selection,
         validate_only=validate_only,
     )
+    _invalidate_pipeline_cache(pipeline_id)
     return {"update_id": update_id}
 
 
 @mcp.tool
-def get_update(pipeline_id: str, update_id: str) -> Dict[str, Any]:
+async def get_update(
+    pipeline_id: str,
+    update_id: str,
+    include_details: bool = True,
+) -> Dict[str, Any]:
     """
     Get pipeline update status and results.
 
     Args:
         pipeline_id: Pipeline ID
         update_id: Update ID from start_update
+        include_details: If False, return only the update state instead of the
+            full update payload. Use this when polling - the state is all a
+            poll loop needs, and it keeps the response small.
 
     Returns:
         Dictionary with update status (QUEUED, RUNNING, COMPLETED, FAILED, etc.)
     """
-    result = _get_update(pipeline_id=pipeline_id, update_id=update_id)
+    result = await run_blocking(
+        _get_update, pipeline_id=pipeline_id, update_id=update_id
+    )
+    if not include_details:
+        update_info = result.update
+        return {
+            "update_id": update_id,
+            "state": update_info.state.value if update_info and update_info.state else None,
+        }
     return result.as_dict() if hasattr(result, 'as_dict') else vars(result)
 
 
 @mcp.tool
-def stop_pipeline(pipeline_id: str) -> Dict[str, str]:
+async def stop_pipeline(pipeline_id: str) -> Dict[str, str]:
     """
     Stop a running pipeline.
 
@@ -180,12 +220,13 @@ def stop_pipeline(pipeline_id: str) -> Dict[str, str]:
     Returns:
         Dictionary with status message.
     """
-    _stop_pipeline(pipeline_id=pipeline_id)
+    await run_blocking(_stop_pipeline, pipeline_id=pipeline_id)
+    _invalidate_pipeline_cache(pipeline_id)
     return {"status": "stopped"}
 
 
 @mcp.tool
-def get_pipeline_events(
+async def get_pipeline_events(
     pipeline_id: str,
     max_results: int = 100,
 ) -> List[Dict[str, Any]]:
@@ -201,12 +242,14 @@ def get_pipeline_events(
     Returns:
         List of event dictionaries with error details.
     """
-    events = _get_pipeline_events(pipeline_id=pipeline_id, max_results=max_results)
+    events = await run_blocking(
+        _get_pipeline_events, pipeline_id=pipeline_id, max_results=max_results
+    )
     return [e.as_dict() if hasattr(e, 'as_dict') else vars(e) for e in events]
 
 
 @mcp.tool
-def create_or_update_pipeline(
+async def create_or_update_pipeline(
     name: str,
     root_path: str,
     catalog: str,
@@ -281,7 +324,8 @@ def create_or_update_pipeline(
             }
         )
     """
-    result = _create_or_update_pipeline(
+    result = await run_blocking(
+        _create_or_update_pipeline,
         name=name,
         root_path=root_path,
         catalog=catalog,
@@ -293,11 +337,12 @@ def create_or_update_pipeline(
         timeout=timeout,
         extra_settings=extra_settings,
     )
+    _invalidate_pipeline_cache(result.pipeline_id)
     return result.to_dict()
 
 
 @mcp.tool
-def find_pipeline_by_name(name: str) -> Dict[str, Any]:
+async def find_pipeline_by_name(name: str) -> Dict[str, Any]:
     """
     Find a pipeline by name and return its ID.
 
@@ -309,7 +354,7 @@ def find_pipeline_by_name(name: str) -> Dict[str, Any]:
         - found: True if pipeline exists
         - pipeline_id: Pipeline ID if found, None otherwise
     """
-    pipeline_id = _find_pipeline_by_name(name=name)
+    pipeline_id = await run_blocking(_find_pipeline_by_name, name=name)
     return {
         "found": pipeline_id is not None,
         "pipeline_id": pipeline_id,
@@ -11,10 +11,11 @@ from databricks_tools_core.sql import (
 )
 
 from ..server import mcp
+from ._concurrency import run_blocking
 
 
 @mcp.tool
-def execute_sql(
+async def execute_sql(
     sql_query: str,
     warehouse_id: Optional[str] = None,
     catalog: Optional[str] = None,
@@ -36,7 +37,8 @@ def execute_sql(
     Returns:
         List of dictionaries, each representing a row with column names as keys.
     """
-    return _execute_sql(
+    return await run_blocking(
+        _execute_sql,
         sql_query=sql_query,
         warehouse_id=warehouse_id,
         catalog=catalog,
@@ -46,7 +48,7 @@ def execute_sql(
 
 
 @mcp.tool
-def execute_sql_multi(
+async def execute_sql_multi(
     sql_content: str,
     warehouse_id: Optional[str] = None,
     catalog: Optional[str] = None,
@@ -71,7 +73,8 @@ def execute_sql_multi(
     Returns:
         Dictionary with results per query and execution summary.
     """
-    return _execute_sql_multi(
+    return await run_blocking(
+        _execute_sql_multi,
         sql_content=sql_content,
         warehouse_id=warehouse_id,
         catalog=catalog,
@@ -82,18 +85,18 @@ def execute_sql_multi(
 
 
 @mcp.tool
-def list_warehouses() -> List[Dict[str, Any]]:
+async def list_warehouses() -> List[Dict[str, Any]]:
     """
     List all SQL warehouses in the workspace.
 
     Returns:
         List of warehouse info dicts with id, name, state, size, etc.
     """
-    return _list_warehouses()
+    return await run_blocking(_list_warehouses)
 
 
 @mcp.tool
-def get_best_warehouse() -> Optional[str]:
+async def get_best_warehouse() -> Optional[str]:
     """
     Get the ID of the best available SQL warehouse.
 
@@ -102,11 +105,11 @@ def get_best_warehouse() -> Optional[str]:
     Returns:
         Warehouse ID string, or None if no warehouses available.
     """
-    return _get_best_warehouse()
+    return await run_blocking(_get_best_warehouse)
 
 
 @mcp.tool
-def get_table_details(
+async def get_table_details(
     catalog: str,
     schema: str,
     table_names: Optional[List[str]] = None,
@@ -132,7 +135,8 @@ def get_table_details(
     """
     # Convert string to enum
     level = TableStatLevel[table_stat_level.upper()]
-    result = _get_table_details(
+    result = await run_blocking(
+        _get_table_details,
         catalog=catalog,
         schema=schema,
         table_names=table_names,
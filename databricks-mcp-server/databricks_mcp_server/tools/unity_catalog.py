@@ -0,0 +1,371 @@
+"""Unity Catalog tools - Browse and manage catalogs, schemas, and tables."""
+import time
+from typing import List, Optional, Dict, Any, Tuple
+
+from databricks.sdk.service.catalog import ColumnInfo, TableType
+
+from databricks_tools_core.unity_catalog.catalogs import (
+    list_catalogs as _list_catalogs,
+    get_catalog as _get_catalog,
+)
+from databricks_tools_core.unity_catalog.schemas import (
+    list_schemas as _list_schemas,
+    get_schema as _get_schema,
+    create_schema as _create_schema,
+    delete_schema as _delete_schema,
+)
+from databricks_tools_core.unity_catalog.tables import (
+    list_tables as _list_tables,
+    list_tables_bulk as _list_tables_bulk,
+    get_table as _get_table,
+    create_table as _create_table,
+    create_tables_bulk as _create_tables_bulk,
+    delete_table as _delete_table,
+)
+
+from ..server import mcp
+from ._concurrency import run_blocking
+
+
+# Table-type strings accepted by the create tools.
+_TABLE_TYPES = {
+    "MANAGED": TableType.MANAGED,
+    "EXTERNAL": TableType.EXTERNAL,
+}
+
+
+def _resolve_table_type(table_type: str) -> TableType:
+    """Map a table-type string to its enum, rejecting unknown values."""
+    try:
+        return _TABLE_TYPES[table_type]
+    except KeyError:
+        raise ValueError(
+            f"Unknown table_type: {table_type!r}. "
+            f"Expected one of: {', '.join(sorted(_TABLE_TYPES))}"
+        ) from None
+
+
+def _as_dict(obj) -> Dict[str, Any]:
+    return obj.as_dict() if hasattr(obj, 'as_dict') else vars(obj)
+
+
+# Catalog metadata changes rarely relative to how often agents re-list it
+# while exploring, so listing tools serve from a short TTL cache. Entries are
+# keyed by ("catalogs",), ("schemas", catalog) or ("tables", catalog, schema)
+# and hold (result, timestamp); mutating tools evict the affected keys so
+# changes made through this server are visible immediately.
+_LIST_CACHE_TTL_SECONDS = 30.0
+_list_cache: Dict[Tuple[str, ...], Tuple[Any, float]] = {}
+
+
+def _cached_list(key: Tuple[str, ...]):
+    entry = _list_cache.get(key)
+    if entry and time.time() - entry[1] < _LIST_CACHE_TTL_SECONDS:
+        return entry[0]
+    return None
+
+
+def _store_list(key: Tuple[str, ...], value) -> None:
+    _list_cache[key] = (value, time.time())
+
+
+def _invalidate_schema_listings(catalog_name: str) -> None:
+    _list_cache.pop(("schemas", catalog_name), None)
+
+
+def _invalidate_table_listings(catalog_name: str, schema_name: str) -> None:
+    _list_cache.pop(("tables", catalog_name, schema_name), None)
+
+
+@mcp.tool
+async def list_catalogs() -> List[Dict[str, Any]]:
+    """
+    List all catalogs in Unity Catalog.
+
+    Returns:
+        List of catalog dictionaries with name, owner, comment, etc.
+    """
+    cached = _cached_list(("catalogs",))
+    if cached is not None:
+        return cached
+
+    catalogs = await run_blocking(_list_catalogs)
+    result = [_as_dict(c) for c in catalogs]
+    _store_list(("catalogs",), result)
+    return result
+
+
+@mcp.tool
+async def get_catalog(catalog_name: str) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific catalog.
+
+    Args:
+        catalog_name: Name of the catalog
+
+    Returns:
+        Dictionary with catalog metadata.
+    """
+    catalog = await run_blocking(_get_catalog, catalog_name=catalog_name)
+    return _as_dict(catalog)
+
+
+@mcp.tool
+async def list_schemas(catalog_name: str) -> List[Dict[str, Any]]:
+    """
+    List all schemas in a catalog.
+
+    Args:
+        catalog_name: Name of the catalog
+
+    Returns:
+        List of schema dictionaries with name, full_name, comment, etc.
+    """
+    cached = _cached_list(("schemas", catalog_name))
+    if cached is not None:
+        return cached
+
+    schemas = await run_blocking(_list_schemas, catalog_name=catalog_name)
+    result = [_as_dict(s) for s in schemas]
+    _store_list(("schemas", catalog_name), result)
+    return result
+
+
+@mcp.tool
+async def get_schema(full_schema_name: str) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific schema.
+
+    Args:
+        full_schema_name: Full schema name (catalog.schema format)
+
+    Returns:
+        Dictionary with schema metadata.
+    """
+    schema = await run_blocking(_get_schema, full_schema_name=full_schema_name)
+    return _as_dict(schema)
+
+
+@mcp.tool
+async def create_schema(
+    catalog_name: str,
+    schema_name: str,
+    comment: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create a new schema in Unity Catalog.
+
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema to create
+        comment: Optional description of the schema
+
+    Returns:
+        Dictionary with created schema metadata.
+    """
+    schema = await run_blocking(
+        _create_schema,
+        catalog_name=catalog_name,
+        schema_name=schema_name,
+        comment=comment,
+    )
+    _invalidate_schema_listings(catalog_name)
+    return _as_dict(schema)
+
+
+@mcp.tool
+async def delete_schema(full_schema_name: str) -> Dict[str, str]:
+    """
+    Delete a schema from Unity Catalog.
+
+    Args:
+        full_schema_name: Full schema name (catalog.schema format)
+
+    Returns:
+        Dictionary with status message.
+    """
+    await run_blocking(_delete_schema, full_schema_name=full_schema_name)
+    catalog_name, _, schema_name = full_schema_name.partition(".")
+    _invalidate_schema_listings(catalog_name)
+    _invalidate_table_listings(catalog_name, schema_name)
+    return {"status": "deleted"}
+
+
+@mcp.tool
+async def list_tables(catalog_name: str, schema_name: str) -> List[Dict[str, Any]]:
+    """
+    List all tables in a schema.
+
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema
+
+    Returns:
+        List of table dictionaries with name, full_name, table_type, etc.
+    """
+    cached = _cached_list(("tables", catalog_name, schema_name))
+    if cached is not None:
+        return cached
+
+    tables = await run_blocking(
+        _list_tables, catalog_name=catalog_name, schema_name=schema_name
+    )
+    result = [_as_dict(t) for t in tables]
+    _store_list(("tables", catalog_name, schema_name), result)
+    return result
+
+
+@mcp.tool
+async def list_catalog_tables(catalog_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    List all tables in every schema of a catalog in one call.
+
+    Instead of calling list_schemas and then list_tables once per schema
+    (one round-trip each), this lists the schemas and fans the per-schema
+    table listings out concurrently - the fastest way to explore a catalog.
+
+    Args:
+        catalog_name: Name of the catalog
+
+    Returns:
+        Dictionary mapping each schema name to its list of table dictionaries.
+    """
+    schemas = await run_blocking(_list_schemas, catalog_name=catalog_name)
+    pairs = [(catalog_name, s.name) for s in schemas if s.name]
+    results = await run_blocking(_list_tables_bulk, pairs)
+    return {
+        schema_name: [_as_dict(t) for t in tables]
+        for (_catalog, schema_name), tables in results.items()
+    }
+
+
+@mcp.tool
+async def get_table(full_table_name: str) -> Dict[str, Any]:
+    """
+    Get detailed information about a specific table.
+
+    Args:
+        full_table_name: Full table name (catalog.schema.table format)
+
+    Returns:
+        Dictionary with table metadata including columns.
+    """
+    table = await run_blocking(_get_table, full_table_name=full_table_name)
+    return _as_dict(table)
+
+
+@mcp.tool
+async def create_table(
+    catalog_name: str,
+    schema_name: str,
+    table_name: str,
+    columns: List[Dict[str, str]],
+    table_type: str = "MANAGED",
+    comment: Optional[str] = None,
+    storage_location: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Create a new table in Unity Catalog.
+
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema
+        table_name: Name of the table to create
+        columns: List of column dicts, e.g. [{"name": "id", "type_name": "INT"}]
+        table_type: "MANAGED" or "EXTERNAL" (default: "MANAGED")
+        comment: Optional description of the table
+        storage_location: Storage location (required for EXTERNAL tables)
+
+    Returns:
+        Dictionary with created table metadata.
+    """
+    column_infos = [
+        ColumnInfo(name=c["name"], type_name=c["type_name"]) for c in columns
+    ]
+    type_enum = _resolve_table_type(table_type)
+
+    table = await run_blocking(
+        _create_table,
+        catalog_name=catalog_name,
+        schema_name=schema_name,
+        table_name=table_name,
+        columns=column_infos,
+        table_type=type_enum,
+        comment=comment,
+        storage_location=storage_location,
+    )
+    _invalidate_table_listings(catalog_name, schema_name)
+    return _as_dict(table)
+
+
+@mcp.tool
+async def create_tables_bulk(
+    catalog_name: str,
+    schema_name: str,
+    tables: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Create many tables in one schema concurrently.
+
+    Bootstrapping a schema with N tables through create_table costs N
+    sequential round-trips; this issues the creates concurrently and keeps
+    going when individual tables fail.
+
+    Args:
+        catalog_name: Name of the catalog
+        schema_name: Name of the schema
+        tables: List of table specs, each with:
+            - name: Table name
+            - columns: List of column dicts, e.g. [{"name": "id", "type_name": "INT"}]
+            - table_type: Optional "MANAGED" or "EXTERNAL" (default: "MANAGED")
+            - comment: Optional description
+            - storage_location: Required for EXTERNAL tables
+
+    Returns:
+        Dictionary with:
+        - created: Number of tables created successfully
+        - failed: Number of tables that failed
+        - results: Per-table outcome dicts with success/full_name/error
+    """
+    specs = [
+        {
+            "catalog_name": catalog_name,
+            "schema_name": schema_name,
+            "table_name": spec["name"],
+            "columns": [
+                ColumnInfo(name=c["name"], type_name=c["type_name"])
+                for c in spec["columns"]
+            ],
+            "table_type": _resolve_table_type(spec.get("table_type", "MANAGED")),
+            "comment": spec.get("comment"),
+            "storage_location": spec.get("storage_location"),
+        }
+        for spec in tables
+    ]
+
+    results = await run_blocking(_create_tables_bulk, specs)
+    _invalidate_table_listings(catalog_name, schema_name)
+    created = sum(1 for r in results if r["success"])
+    return {
+        "created": created,
+        "failed": len(results) - created,
+        "results": results,
+    }
+
+
+@mcp.tool
+async def delete_table(full_table_name: str) -> Dict[str, str]:
+    """
+    Delete a table from Unity Catalog.
+
+    Args:
+        full_table_name: Full table name (catalog.schema.table format)
+
+    Returns:
+        Dictionary with status message.
+    """
+    await run_blocking(_delete_table, full_table_name=full_table_name)
+    parts = full_table_name.split(".")
+    if len(parts) == 3:
+        _invalidate_table_listings(parts[0], parts[1])
+    return {"status": "deleted"}
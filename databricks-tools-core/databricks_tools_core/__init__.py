@@ -8,10 +8,16 @@ Organized by product line for scalability.
 __version__ = "0.1.0"
 
 # Auth utilities
-from .auth import get_workspace_client, set_databricks_auth, clear_databricks_auth
+from .auth import (
+    get_workspace_client,
+    set_databricks_auth,
+    clear_databricks_auth,
+    clear_client_cache,
+)
 
 __all__ = [
     'get_workspace_client',
     'set_databricks_auth',
     'clear_databricks_auth',
+    'clear_client_cache',
 ]
@@ -20,16 +20,69 @@ Usage in functions:
         # ...
 """
 
+import os
 from contextvars import ContextVar
+from functools import lru_cache
 from typing import Optional
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.core import Config
 
 # Context variables for per-request authentication
 _host_ctx: ContextVar[Optional[str]] = ContextVar('databricks_host', default=None)
 _token_ctx: ContextVar[Optional[str]] = ContextVar('databricks_token', default=None)
 
 
+# Connection pool sizing for the SDK's HTTP session, passed through the
+# supported Config knobs. The default pool keeps ~10 connections per host, so
+# concurrent fan-out (bulk listings, parallel polling) opens and tears down
+# extra TCP+TLS connections. A larger pool keeps them alive across calls.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+
+@lru_cache(maxsize=16)
+def _cached_client(host: Optional[str], token: Optional[str]) -> WorkspaceClient:
+    """Build (or reuse) a WorkspaceClient for the given credentials.
+
+    Constructing a WorkspaceClient re-parses config and sets up a new HTTP
+    session each time, which dominates latency for short API calls. Caching
+    by (host, token) lets repeated calls share one client and its underlying
+    connection pool. The (None, None) entry is the default-auth client.
+    """
+    if not (host and token):
+        # When both env vars are present, pass them explicitly so the SDK
+        # skips the rest of its auth resolution chain (config file walk and,
+        # on cloud hosts, metadata-service probes) on first construction.
+        host = os.environ.get("DATABRICKS_HOST")
+        token = os.environ.get("DATABRICKS_TOKEN")
+
+    if host and token:
+        config = Config(
+            host=host,
+            token=token,
+            max_connection_pools=_POOL_CONNECTIONS,
+            max_connections_per_pool=_POOL_MAXSIZE,
+        )
+    else:
+        # Fall back to default authentication (config file, metadata service)
+        config = Config(
+            max_connection_pools=_POOL_CONNECTIONS,
+            max_connections_per_pool=_POOL_MAXSIZE,
+        )
+
+    return WorkspaceClient(config=config)
+
+
+def clear_client_cache() -> None:
+    """Drop all cached WorkspaceClient instances.
+
+    Useful in tests or after credentials/environment changes that should
+    force a fresh client on the next get_workspace_client() call.
+    """
+    _cached_client.cache_clear()
+
+
 def set_databricks_auth(host: Optional[str], token: Optional[str]) -> None:
     """Set Databricks authentication for the current async context.
 
@@ -62,14 +115,11 @@ def get_workspace_client() -> WorkspaceClient:
     2. Environment variables (DATABRICKS_HOST, DATABRICKS_TOKEN)
     3. Databricks config file (~/.databrickscfg)
 
+    Clients are cached per (host, token) pair, so repeated calls reuse the
+    same client and its HTTP connection pool instead of re-running config
+    discovery and auth setup. Call clear_client_cache() to force new clients.
+
     Returns:
         Configured WorkspaceClient instance
     """
-    host = _host_ctx.get()
-    token = _token_ctx.get()
-
-    if host and token:
-        return WorkspaceClient(host=host, token=token)
-
-    # Fall back to default authentication (env vars, config file)
-    return WorkspaceClient()
+    return _cached_client(_host_ctx.get(), _token_ctx.get())
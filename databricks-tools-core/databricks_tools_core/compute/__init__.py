@@ -6,22 +6,26 @@ Functions for executing code on Databricks clusters.
 
 from .execution import (
     ExecutionResult,
+    ExecutionContextPool,
     NoRunningClusterError,
     list_clusters,
     get_best_cluster,
     create_context,
     destroy_context,
     execute_databricks_command,
+    execute_databricks_commands,
     run_python_file_on_databricks,
 )
 
 __all__ = [
     "ExecutionResult",
+    "ExecutionContextPool",
     "NoRunningClusterError",
     "list_clusters",
     "get_best_cluster",
     "create_context",
     "destroy_context",
     "execute_databricks_command",
+    "execute_databricks_commands",
     "run_python_file_on_databricks",
 ]
@@ -4,11 +4,15 @@ Compute - Execution Context Operations
 Functions for executing code on Databricks clusters using execution contexts.
 Uses Databricks Command Execution API via SDK.
 """
-import datetime
-from typing import Optional, List, Dict, Any
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
 from databricks.sdk.service.compute import (
     CommandStatus,
     ClusterSource,
+    ContextStatus,
     Language,
     ListClustersFilterBy,
     State,
@@ -32,6 +36,18 @@ class ExecutionResult:
         message: A helpful message about reusing the context.
     """
 
+    # Slots keep per-instance memory down and make attribute access a fixed
+    # offset instead of a dict lookup - results can pile up in batch workloads.
+    __slots__ = (
+        "success",
+        "output",
+        "error",
+        "cluster_id",
+        "context_id",
+        "context_destroyed",
+        "message",
+    )
+
     def __init__(
         self,
         success: bool,
@@ -62,13 +78,23 @@ class ExecutionResult:
         else:
             self.message = None
 
+    # Cap for output/error text in __repr__ - command outputs can be multi-MB
+    # and repr is usually just logged, so don't escape the whole thing.
+    _REPR_LIMIT = 200
+
     def __repr__(self):
         if self.success:
+            output = self.output or ""
+            if len(output) > self._REPR_LIMIT:
+                output = output[:self._REPR_LIMIT] + "..."
             return (
-                f"ExecutionResult(success=True, output={repr(self.output)}, "
-                f"cluster_id={repr(self.cluster_id)}, context_id={repr(self.context_id)})"
+                f"ExecutionResult(success=True, output={output!r}, "
+                f"cluster_id={self.cluster_id!r}, context_id={self.context_id!r})"
             )
-        return f"ExecutionResult(success=False, error={repr(self.error)})"
+        error = self.error or ""
+        if len(error) > self._REPR_LIMIT:
+            error = error[:self._REPR_LIMIT] + "..."
+        return f"ExecutionResult(success=False, error={error!r})"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -86,6 +112,9 @@ class ExecutionResult:
 # Only list user-created clusters (UI or API), not job/pipeline clusters
 _USER_CLUSTER_SOURCES = [ClusterSource.UI, ClusterSource.API]
 
+# Command statuses that mean the command terminated unsuccessfully
+_TERMINAL_FAILURE_STATUSES = frozenset({CommandStatus.ERROR, CommandStatus.CANCELLED})
+
 # Language string to enum mapping
 _LANGUAGE_MAP = {
     "python": Language.PYTHON,
@@ -259,6 +288,68 @@ def destroy_context(cluster_id: str, context_id: str) -> None:
     )
 
 
+# Background pool for fire-and-forget context destruction. Callers never read
+# the destroy result (errors are already swallowed), so there is no reason to
+# block on the round-trip; atexit drains pending destroys before exit.
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="dbx-destroy")
+atexit.register(_CLEANUP_POOL.shutdown, wait=True)
+
+
+def _destroy_context_async(cluster_id: str, context_id: str) -> None:
+    """Schedule context destruction in the background, ignoring errors."""
+
+    def _safe_destroy():
+        try:
+            destroy_context(cluster_id, context_id)
+        except Exception:
+            pass  # Ignore cleanup errors
+
+    _CLEANUP_POOL.submit(_safe_destroy)
+
+
+# Polling schedule for command completion. The SDK's built-in waiter sleeps a
+# full second between status checks, so even a trivial command pays ~1s of
+# latency. Start fast so short commands return in roughly one round-trip, and
+# back off exponentially so long-running commands don't hammer the API.
+_POLL_INITIAL_SECONDS = 0.05
+_POLL_BACKOFF_FACTOR = 1.5
+_POLL_MAX_SECONDS = 2.0
+
+
+def _wait_for_command(w, cluster_id: str, context_id: str, command_id: str, timeout: int):
+    """
+    Poll a command's status until it reaches a terminal state or times out.
+
+    Args:
+        w: WorkspaceClient to poll with
+        cluster_id: ID of the cluster
+        context_id: ID of the execution context
+        command_id: ID of the running command
+        timeout: Maximum time to wait (seconds)
+
+    Returns:
+        Final CommandStatusResponse (FINISHED, ERROR, or CANCELLED)
+
+    Raises:
+        TimeoutError: If the command doesn't terminate within timeout
+    """
+    deadline = time.monotonic() + timeout
+    interval = _POLL_INITIAL_SECONDS
+    while True:
+        status = w.command_execution.command_status(
+            cluster_id=cluster_id,
+            context_id=context_id,
+            command_id=command_id,
+        )
+        if status.status == CommandStatus.FINISHED or status.status in _TERMINAL_FAILURE_STATUSES:
+            return status
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Command did not finish within {timeout} seconds")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * _POLL_BACKOFF_FACTOR, _POLL_MAX_SECONDS)
+
+
 def _execute_on_context(
     cluster_id: str,
     context_id: str,
@@ -283,13 +374,17 @@ def _execute_on_context(
     lang_enum = _LANGUAGE_MAP.get(language.lower(), Language.PYTHON)
 
     try:
-        # Execute and wait for result with timeout
-        result = w.command_execution.execute(
+        # Submit the command, then poll its status ourselves instead of using
+        # the SDK waiter's fixed 1s sleep (see _wait_for_command).
+        waiter = w.command_execution.execute(
             cluster_id=cluster_id,
             context_id=context_id,
             language=lang_enum,
             command=code
-        ).result(timeout=datetime.timedelta(seconds=timeout))
+        )
+        result = _wait_for_command(
+            w, cluster_id, context_id, waiter.response.id, timeout
+        )
 
         # Check result status (compare with enum values)
         if result.status == CommandStatus.FINISHED:
@@ -307,14 +402,18 @@ def _execute_on_context(
                 result.results.data if result.results and result.results.data
                 else "Success (no output)"
             )
+            # Command output is normally already a str; only convert when the
+            # API hands back something else, so large outputs aren't copied.
+            if not isinstance(output, str):
+                output = str(output)
             return ExecutionResult(
                 success=True,
-                output=str(output),
+                output=output,
                 cluster_id=cluster_id,
                 context_id=context_id,
                 context_destroyed=False,
             )
-        elif result.status in [CommandStatus.ERROR, CommandStatus.CANCELLED]:
+        elif result.status in _TERMINAL_FAILURE_STATUSES:
             error_msg = (
                 result.results.cause if result.results and result.results.cause
                 else "Unknown error"
@@ -345,6 +444,144 @@ def _execute_on_context(
         )
 
 
+class ExecutionContextPool:
+    """
+    Reuses execution contexts across commands to amortize create/destroy cost.
+
+    Creating an execution context is a blocking REST round-trip that waits for
+    the cluster to allocate a REPL (hundreds of ms to seconds), and destroying
+    it is another round-trip. For workloads that run many one-off commands,
+    this overhead dominates wall time. The pool keeps one live context per
+    (cluster_id, language) pair and reuses it for every command, so N commands
+    pay ~2 round-trips of context overhead instead of 2N.
+
+    Contexts are destroyed when close_all() is called; the pool registers an
+    atexit hook so this happens automatically on interpreter shutdown.
+
+    Example:
+        >>> pool = ExecutionContextPool()
+        >>> result = pool.run("x = 1", cluster_id="abc-123")
+        >>> result = pool.run("print(x)", cluster_id="abc-123")  # same context
+        >>> pool.close_all()
+    """
+
+    def __init__(self):
+        self._contexts: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close_all)
+
+    @staticmethod
+    def _context_alive(cluster_id: str, context_id: str) -> bool:
+        """Check whether a pooled context still exists on the cluster."""
+        try:
+            w = get_workspace_client()
+            status = w.command_execution.context_status(
+                cluster_id=cluster_id,
+                context_id=context_id,
+            )
+            return status.status != ContextStatus.ERROR
+        except Exception:
+            # Context gone (cluster restarted, context expired, etc.)
+            return False
+
+    def get_context(self, cluster_id: str, language: str = "python") -> str:
+        """
+        Get a live context for the cluster/language pair, creating one on first use.
+
+        Cached contexts are verified with a cheap status probe before being
+        returned, so a context that died (e.g. cluster restart) is replaced
+        transparently instead of failing the next command.
+
+        Args:
+            cluster_id: ID of the cluster
+            language: Programming language ("python", "scala", "sql", "r")
+
+        Returns:
+            Context ID string
+        """
+        key = (cluster_id, language.lower())
+        with self._lock:
+            context_id = self._contexts.get(key)
+        if context_id is not None:
+            if self._context_alive(cluster_id, context_id):
+                return context_id
+            # Stale entry - drop it (only if nobody replaced it meanwhile)
+            with self._lock:
+                if self._contexts.get(key) == context_id:
+                    del self._contexts[key]
+
+        # Create outside the lock - it's a slow REST call
+        context_id = create_context(cluster_id, language)
+        with self._lock:
+            existing = self._contexts.setdefault(key, context_id)
+        if existing is not context_id:
+            # Another thread won the race; destroy the extra context
+            try:
+                destroy_context(cluster_id, context_id)
+            except Exception:
+                pass
+            return existing
+        return context_id
+
+    def run(
+        self,
+        code: str,
+        cluster_id: str,
+        language: str = "python",
+        timeout: int = 120,
+    ) -> ExecutionResult:
+        """
+        Execute code on a pooled context, creating the context on first use.
+
+        Args:
+            code: Code to execute
+            cluster_id: ID of the cluster
+            language: Programming language ("python", "scala", "sql", "r")
+            timeout: Maximum time to wait for execution (seconds)
+
+        Returns:
+            ExecutionResult with output or error (context stays alive for reuse)
+        """
+        context_id = self.get_context(cluster_id, language)
+        return _execute_on_context(
+            cluster_id=cluster_id,
+            context_id=context_id,
+            code=code,
+            language=language,
+            timeout=timeout,
+        )
+
+    def discard(self, cluster_id: str, language: str = "python") -> None:
+        """
+        Drop and destroy the pooled context for a cluster/language pair.
+
+        Use this when a context has become unusable (e.g. the cluster was
+        restarted); the next run() call will create a fresh one.
+
+        Args:
+            cluster_id: ID of the cluster
+            language: Programming language ("python", "scala", "sql", "r")
+        """
+        with self._lock:
+            context_id = self._contexts.pop((cluster_id, language.lower()), None)
+        if context_id:
+            try:
+                destroy_context(cluster_id, context_id)
+            except Exception:
+                pass  # Ignore cleanup errors
+
+    def close_all(self) -> None:
+        """Destroy all pooled contexts. Safe to call multiple times."""
+        with self._lock:
+            contexts = list(self._contexts.items())
+            self._contexts.clear()
+        for (cluster_id, _language), context_id in contexts:
+            try:
+                destroy_context(cluster_id, context_id)
+            except Exception:
+                pass  # Ignore cleanup errors
+
+
 def execute_databricks_command(
     code: str,
     cluster_id: Optional[str] = None,
@@ -404,27 +641,90 @@ def execute_databricks_command(
             timeout=timeout
         )
 
-        # Destroy context if requested
+        # Destroy context if requested. The destroy round-trip happens in the
+        # background so the caller gets the result without waiting on it.
         if destroy_context_on_completion:
-            try:
-                destroy_context(cluster_id, context_id)
-                result.context_destroyed = True
-                result.message = "Execution successful. Context was destroyed."
-            except Exception:
-                pass  # Ignore cleanup errors
+            _destroy_context_async(cluster_id, context_id)
+            result.context_destroyed = True
+            result.message = "Execution successful. Context was destroyed."
 
         return result
 
-    except Exception as e:
+    except Exception:
         # If we created the context and there's an error, clean up
         if context_created and destroy_context_on_completion:
-            try:
-                destroy_context(cluster_id, context_id)
-            except Exception:
-                pass
+            _destroy_context_async(cluster_id, context_id)
         raise
 
 
+def execute_databricks_commands(
+    codes: List[str],
+    cluster_id: Optional[str] = None,
+    language: str = "python",
+    timeout: int = 120,
+    destroy_context_on_completion: bool = False,
+) -> List[ExecutionResult]:
+    """
+    Execute multiple code snippets on a single shared execution context.
+
+    Running N snippets through execute_databricks_command costs N context
+    creations (each a blocking REST round-trip). This creates one context,
+    runs every snippet against it in order (so later snippets see state from
+    earlier ones), and optionally destroys the context at the end - N+2
+    round-trips instead of 3N.
+
+    Args:
+        codes: List of code snippets to execute in order
+        cluster_id: ID of the cluster. If not provided, auto-selects a running
+                   cluster (prefers clusters with "shared" or "demo" in name).
+        language: Programming language ("python", "scala", "sql", "r")
+        timeout: Maximum time to wait for each snippet (seconds)
+        destroy_context_on_completion: If True, destroys the shared context
+                                       after the last snippet. Default is False
+                                       to allow reuse via the returned results.
+
+    Returns:
+        List of ExecutionResult, one per snippet, in input order. All results
+        share the same cluster_id/context_id.
+
+    Raises:
+        NoRunningClusterError: If no cluster_id provided and no running cluster found
+        DatabricksError: If API request fails
+    """
+    # Auto-select cluster if not provided
+    if cluster_id is None:
+        cluster_id = get_best_cluster()
+        if cluster_id is None:
+            available_clusters = list_clusters(limit=20)
+            raise NoRunningClusterError(available_clusters)
+
+    context_id = create_context(cluster_id, language)
+
+    results = []
+    try:
+        for code in codes:
+            results.append(_execute_on_context(
+                cluster_id=cluster_id,
+                context_id=context_id,
+                code=code,
+                language=language,
+                timeout=timeout,
+            ))
+    finally:
+        if destroy_context_on_completion:
+            _destroy_context_async(cluster_id, context_id)
+            for result in results:
+                result.context_destroyed = True
+                # Replace the constructor's reuse hint - it points at the
+                # context that was just scheduled for destruction.
+                result.message = (
+                    "Execution successful. Context was destroyed."
+                    if result.success else None
+                )
+
+    return results
+
+
 def run_python_file_on_databricks(
     file_path: str,
     cluster_id: Optional[str] = None,
@@ -1,2 +1,2 @@
 """Spark Declarative Pipelines (SDP) operations"""
-from . import pipelines, workspace_files
+from . import pipelines, pipelines_async, workspace_files
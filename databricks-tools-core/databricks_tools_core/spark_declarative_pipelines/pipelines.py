@@ -4,9 +4,13 @@ Spark Declarative Pipelines - Pipeline Management
 Functions for managing SDP pipeline lifecycle using Databricks Pipelines API.
 All pipelines use Unity Catalog and serverless compute by default.
 """
+import threading
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from itertools import islice
+from typing import Iterator, List, Optional, Dict, Any, Tuple
+
+from databricks.sdk.errors import DatabricksError, NotFound
 
 from databricks.sdk.service.pipelines import (
     CreatePipelineResponse,
@@ -109,6 +113,33 @@ RUNNING_STATES = {
 }
 
 
+# Last-known pipeline state, keyed by pipeline_id with a short TTL. Tear-down
+# automation often stops pipelines that were just observed idle; the cache
+# lets stop_pipeline skip that redundant round-trip. The TTL is deliberately
+# tiny - state can change at any moment, so stale reads must age out fast.
+_STATE_CACHE_TTL_SECONDS = 5.0
+_pipeline_state_cache: Dict[str, Tuple[str, float]] = {}
+_state_cache_lock = threading.Lock()
+
+
+def _cache_pipeline_state(pipeline_id: str, state: Optional[str]) -> None:
+    """Record a pipeline's last-known state (or drop it if state is None)."""
+    with _state_cache_lock:
+        if state is None:
+            _pipeline_state_cache.pop(pipeline_id, None)
+        else:
+            _pipeline_state_cache[pipeline_id] = (state, time.time())
+
+
+def _cached_pipeline_state(pipeline_id: str) -> Optional[str]:
+    """Return the pipeline's last-known state if it's still fresh."""
+    with _state_cache_lock:
+        entry = _pipeline_state_cache.get(pipeline_id)
+    if entry and time.time() - entry[1] < _STATE_CACHE_TTL_SECONDS:
+        return entry[0]
+    return None
+
+
 def _build_libraries(workspace_file_paths: List[str]) -> List[PipelineLibrary]:
     """Build PipelineLibrary list from file paths."""
     return [
@@ -117,6 +148,15 @@ def _build_libraries(workspace_file_paths: List[str]) -> List[PipelineLibrary]:
     ]
 
 
+def _format_error(e: Exception) -> str:
+    """Format an exception for result messages, using SDK fields when available."""
+    if isinstance(e, DatabricksError) and e.error_code:
+        # str(e) already carries the message; DatabricksError has no
+        # .message attribute in the pinned SDK version.
+        return f"{e.error_code}: {e}"
+    return str(e)
+
+
 def _extract_error_details(events: List[PipelineEvent]) -> List[Dict[str, Any]]:
     """Extract error details from pipeline events for LLM consumption."""
     errors = []
@@ -281,7 +321,12 @@ def get_pipeline(pipeline_id: str) -> GetPipelineResponse:
         GetPipelineResponse with full pipeline configuration and state
     """
     w = get_workspace_client()
-    return w.pipelines.get(pipeline_id=pipeline_id)
+    response = w.pipelines.get(pipeline_id=pipeline_id)
+    _cache_pipeline_state(
+        pipeline_id,
+        response.state.value if response.state else None,
+    )
+    return response
 
 
 def update_pipeline(
@@ -342,11 +387,18 @@ def delete_pipeline(pipeline_id: str) -> None:
     """
     Delete a pipeline.
 
+    Deleting an already-deleted pipeline is treated as success, so tear-down
+    scripts can call this unconditionally.
+
     Args:
         pipeline_id: Pipeline ID
     """
     w = get_workspace_client()
-    w.pipelines.delete(pipeline_id=pipeline_id)
+    try:
+        w.pipelines.delete(pipeline_id=pipeline_id)
+    except NotFound:
+        pass  # Already gone - the desired end state
+    _cache_pipeline_state(pipeline_id, None)
 
 
 def start_update(
@@ -379,6 +431,10 @@ def start_update(
         validate_only=validate_only
     )
 
+    # The pipeline is no longer idle - drop the cached state so a follow-up
+    # stop_pipeline can't be skipped based on a pre-update IDLE observation.
+    _cache_pipeline_state(pipeline_id, None)
+
     return response.update_id
 
 
@@ -404,11 +460,19 @@ def stop_pipeline(pipeline_id: str) -> None:
     """
     Stop a running pipeline.
 
+    Skips the API call if the pipeline was observed IDLE within the last few
+    seconds (see _pipeline_state_cache), which saves a round-trip in
+    tear-down scripts that call get_pipeline immediately before stopping.
+
     Args:
         pipeline_id: Pipeline ID
     """
+    if _cached_pipeline_state(pipeline_id) == "IDLE":
+        return
+
     w = get_workspace_client()
     w.pipelines.stop(pipeline_id=pipeline_id)
+    _cache_pipeline_state(pipeline_id, None)
 
 
 def get_pipeline_events(
@@ -427,12 +491,34 @@ def get_pipeline_events(
     Returns:
         List of PipelineEvent objects with error details
     """
+    # islice bounds materialization: the SDK iterator paginates lazily, so we
+    # stop fetching/parsing once max_results events are in hand.
+    return list(islice(iter_pipeline_events(pipeline_id, max_results), max_results))
+
+
+def iter_pipeline_events(
+    pipeline_id: str,
+    max_results: int = 100
+) -> Iterator[PipelineEvent]:
+    """
+    Iterate over pipeline events without materializing them in a list.
+
+    Use this instead of get_pipeline_events when processing events one at a
+    time (e.g. scanning for the first error) - events are fetched page by
+    page as the iterator is consumed.
+
+    Args:
+        pipeline_id: Pipeline ID
+        max_results: Page size hint passed to the API
+
+    Returns:
+        Iterator of PipelineEvent objects
+    """
     w = get_workspace_client()
-    events = w.pipelines.list_pipeline_events(
+    return w.pipelines.list_pipeline_events(
         pipeline_id=pipeline_id,
         max_results=max_results
     )
-    return list(events)
 
 
 def wait_for_pipeline_update(
@@ -448,7 +534,8 @@ def wait_for_pipeline_update(
         pipeline_id: Pipeline ID
         update_id: Update ID from start_update
         timeout: Maximum wait time in seconds (default: 30 minutes)
-        poll_interval: Time between status checks in seconds
+        poll_interval: Maximum time between status checks in seconds; polling
+            starts faster and backs off toward this cap
 
     Returns:
         Dictionary with detailed update results:
@@ -463,6 +550,10 @@ def wait_for_pipeline_update(
     w = get_workspace_client()
     start_time = time.time()
 
+    # Poll with backoff: start fast so short updates (e.g. validations) return
+    # promptly, then grow toward poll_interval so long runs don't hammer the API.
+    interval = min(0.5, poll_interval)
+
     while True:
         elapsed = time.time() - start_time
 
@@ -479,7 +570,8 @@ def wait_for_pipeline_update(
 
         update_info = response.update
         if not update_info:
-            time.sleep(poll_interval)
+            time.sleep(interval)
+            interval = min(interval * 1.5, poll_interval)
             continue
 
         state = update_info.state
@@ -500,7 +592,8 @@ def wait_for_pipeline_update(
 
             return result
 
-        time.sleep(poll_interval)
+        time.sleep(interval)
+        interval = min(interval * 1.5, poll_interval)
 
 
 def create_or_update_pipeline(
@@ -589,6 +682,7 @@ def create_or_update_pipeline(
             )
     except Exception as e:
         # Return detailed error for LLM consumption
+        error_message = _format_error(e)
         return PipelineRunResult(
             pipeline_id=existing_pipeline_id or "unknown",
             pipeline_name=name,
@@ -597,8 +691,8 @@ def create_or_update_pipeline(
             root_path=root_path,
             success=False,
             created=False,
-            error_message=str(e),
-            message=f"Failed to {'create' if created else 'update'} pipeline: {e}",
+            error_message=error_message,
+            message=f"Failed to {'create' if created else 'update'} pipeline: {error_message}",
         )
 
     # Build result with context
@@ -628,7 +722,7 @@ def create_or_update_pipeline(
             )
         except Exception as e:
             result.success = False
-            result.error_message = f"Pipeline created but failed to start run: {e}"
+            result.error_message = f"Pipeline created but failed to start run: {_format_error(e)}"
             result.message = result.error_message
             return result
 
@@ -0,0 +1,58 @@
+"""
+Spark Declarative Pipelines - Async Helpers
+
+Async wrappers around the blocking pipelines API for callers that monitor
+many pipeline updates concurrently from one event loop.
+"""
+import asyncio
+
+from databricks.sdk.service.pipelines import GetUpdateResponse
+
+from .pipelines import TERMINAL_STATES, get_update
+
+
+async def await_update(
+    pipeline_id: str,
+    update_id: str,
+    timeout: int = 1800,
+    poll_interval: float = 5.0,
+) -> GetUpdateResponse:
+    """
+    Wait for a pipeline update to reach a terminal state without blocking the event loop.
+
+    Each status check runs the blocking get_update in a worker thread via
+    asyncio.to_thread, so dozens of updates can be awaited concurrently:
+
+        results = await asyncio.gather(
+            *[await_update(p, u) for p, u in pairs]
+        )
+
+    Args:
+        pipeline_id: Pipeline ID
+        update_id: Update ID from start_update
+        timeout: Maximum wait time in seconds (default: 30 minutes)
+        poll_interval: Time between status checks in seconds
+
+    Returns:
+        Final GetUpdateResponse (state COMPLETED, FAILED, or CANCELED)
+
+    Raises:
+        TimeoutError: If the update doesn't complete within timeout
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    while True:
+        response = await asyncio.to_thread(get_update, pipeline_id, update_id)
+
+        update_info = response.update
+        if update_info and update_info.state in TERMINAL_STATES:
+            return response
+
+        if loop.time() >= deadline:
+            raise TimeoutError(
+                f"Pipeline update {update_id} did not complete within {timeout} seconds. "
+                f"Check pipeline status in Databricks UI or call get_update(pipeline_id='{pipeline_id}', update_id='{update_id}')."
+            )
+
+        await asyncio.sleep(poll_interval)
@@ -3,7 +3,8 @@ Unity Catalog - Table Operations
 
 Functions for managing tables in Unity Catalog.
 """
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from databricks.sdk.service.catalog import TableInfo, ColumnInfo, TableType, DataSourceFormat
 
 from ..auth import get_workspace_client
@@ -30,6 +31,42 @@ def list_tables(catalog_name: str, schema_name: str) -> List[TableInfo]:
     ))
 
 
+def list_tables_bulk(
+    pairs: List[Tuple[str, str]],
+    max_workers: int = 16,
+) -> Dict[Tuple[str, str], List[TableInfo]]:
+    """
+    List tables for many (catalog, schema) pairs concurrently.
+
+    Listing N schemas through list_tables costs N sequential REST round-trips.
+    The calls are independent and I/O-bound, so issuing them through a thread
+    pool overlaps the network latency - useful for catalog browsing, where a
+    caller wants the tables of every schema in a catalog at once.
+
+    Args:
+        pairs: List of (catalog_name, schema_name) tuples to list
+        max_workers: Maximum concurrent requests. Keep modest to stay well
+                     under Databricks API rate limits.
+
+    Returns:
+        Dict mapping each (catalog_name, schema_name) pair to its list of
+        TableInfo objects, in input order.
+
+    Raises:
+        DatabricksError: If any API request fails
+    """
+    w = get_workspace_client()
+    list_fn = w.tables.list  # bind once; avoids attribute lookups per task
+
+    def _list_one(pair: Tuple[str, str]) -> List[TableInfo]:
+        catalog_name, schema_name = pair
+        return list(list_fn(catalog_name=catalog_name, schema_name=schema_name))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(len(pairs), 1))) as executor:
+        results = executor.map(_list_one, pairs)
+        return dict(zip(pairs, results))
+
+
 def get_table(full_table_name: str) -> TableInfo:
     """
     Get detailed information about a specific table.
@@ -85,28 +122,24 @@ def create_table(
     # Build full table name for updates
     full_name = f"{catalog_name}.{schema_name}.{table_name}"
 
-    # Build kwargs - name should be just the table name, not full path
+    # storage_location only applies to EXTERNAL tables; MANAGED tables don't
+    # need it in newer SDK versions
+    if table_type is TableType.EXTERNAL and not storage_location:
+        raise ValueError("storage_location is required for EXTERNAL tables")
+
+    # Build kwargs in one literal - name should be just the table name, not
+    # full path. Note: comment is not supported in create(); it's set via a
+    # separate update() call after creation.
     kwargs = {
         "name": table_name,
         "catalog_name": catalog_name,
         "schema_name": schema_name,
         "table_type": table_type,
         "columns": columns,
-        "data_source_format": DataSourceFormat.DELTA
+        "data_source_format": DataSourceFormat.DELTA,
+        **({"storage_location": storage_location} if table_type is TableType.EXTERNAL else {}),
     }
 
-    # Add storage_location - required for all tables, use default for MANAGED
-    if table_type == TableType.EXTERNAL:
-        if not storage_location:
-            raise ValueError("storage_location is required for EXTERNAL tables")
-        kwargs["storage_location"] = storage_location
-    else:
-        # MANAGED tables don't need storage_location in newer SDK versions
-        pass
-
-    # Note: comment parameter removed as it's not supported in create()
-    # Comments must be set via ALTER TABLE after creation
-
     table = w.tables.create(**kwargs)
 
     # Update comment if provided (via separate API call)
@@ -119,6 +152,46 @@ def create_table(
     return table
 
 
+def create_tables_bulk(
+    specs: List[Dict],
+    max_workers: int = 8,
+) -> List[Dict]:
+    """
+    Create many tables concurrently and report per-table outcomes.
+
+    Bootstrapping a schema often means creating dozens of tables; doing it
+    through create_table serially costs one round-trip each. This fans the
+    independent create calls out over a thread pool and keeps going when
+    individual creates fail, so one bad spec doesn't abort the batch.
+
+    Args:
+        specs: List of keyword-argument dicts for create_table, e.g.
+               [{"catalog_name": ..., "schema_name": ..., "table_name": ...,
+                 "columns": [...]}, ...]
+        max_workers: Maximum concurrent requests. Keep modest to stay well
+                     under Databricks API rate limits.
+
+    Returns:
+        List of result dicts in input order, each with:
+        - success: Whether the table was created
+        - full_name: Full table name (if created)
+        - error: Error message (if failed)
+    """
+    def _create_one(spec: Dict) -> Dict:
+        try:
+            table = create_table(**spec)
+            return {"success": True, "full_name": table.full_name, "error": None}
+        except Exception as e:
+            full_name = ".".join(
+                str(spec.get(k, "?"))
+                for k in ("catalog_name", "schema_name", "table_name")
+            )
+            return {"success": False, "full_name": full_name, "error": str(e)}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, max(len(specs), 1))) as executor:
+        return list(executor.map(_create_one, specs))
+
+
 def delete_table(full_table_name: str) -> None:
     """
     Delete a table from Unity Catalog.